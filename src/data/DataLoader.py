@@ -20,13 +20,20 @@ class FinancialDataLoader:
         self.end_date = end_date
 
     def load_price_data(self) -> pd.DataFrame:
+        return self.load_ohlc_data()["Close"]
+
+    def load_ohlc_data(self) -> dict:
+        """Open/High/Low/Close matrices (index = dates, columns = tickers), e.g. for local indicators."""
         print(f"Loading price data for: {', '.join(self.tickers)}")
         data = yf.download(self.tickers, start=self.start_date, end=self.end_date, auto_adjust=True)
-        close = data['Close']
-        if isinstance(close, pd.Series):
-            close = close.to_frame()
-        close.columns = [str(t) for t in close.columns]
-        return close
+        ohlc = {}
+        for field in ["Open", "High", "Low", "Close"]:
+            frame = data[field]
+            if isinstance(frame, pd.Series):
+                frame = frame.to_frame()
+            frame.columns = [str(t) for t in frame.columns]
+            ohlc[field] = frame
+        return ohlc
 
 
 # ======================== PRICE AND RETURN DATA ============================
@@ -172,6 +179,9 @@ def get_insider_trading_fmp(ticker: str) -> dict:
 
 
 def get_technical_indicator(ticker: str, indicator: str = "SMA", interval: str = "daily", time_period: int = 20, series_type: str = "close") -> dict:
+    """Single indicator from Alpha Vantage (one request per call).
+    For many tickers/windows use src.modules.indicators.technical.TechnicalIndicatorEngine instead,
+    it uses the same SMA seeding (only MACD differs slightly during the warm-up period)."""
     url = f"https://www.alphavantage.co/query?function={indicator}&symbol={ticker}&interval={interval}&time_period={time_period}&series_type={series_type}&apikey={ALPHA_VANTAGE_API_KEY}"
     return requests.get(url).json()
 
@@ -0,0 +1,338 @@
+import numpy as np
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# ======================== KERNELS ============================
+
+def _rolling_moments(values: np.ndarray, windows: list[int]) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Rolling mean and population std for several windows from one set of cumulative sums.
+
+    values has shape (dates, tickers). A window is only valid if it contains no NaN.
+    Each column is shifted by its first valid value before summing, so that E[x²] - E[x]²
+    does not lose precision on long or high-priced series.
+    """
+    n_dates, n_tickers = values.shape
+    valid = ~np.isnan(values)
+    offset = np.zeros(n_tickers)
+    if n_dates:
+        first = values[np.argmax(valid, axis=0), np.arange(n_tickers)]
+        offset = np.where(np.isnan(first), 0.0, first)
+    filled = np.where(valid, values - offset, 0.0)
+    zeros = np.zeros((1, n_tickers))
+    csum = np.vstack([zeros, np.cumsum(filled, axis=0)])
+    csq = np.vstack([zeros, np.cumsum(filled ** 2, axis=0)])
+    ccount = np.vstack([zeros, np.cumsum(valid, axis=0)])
+
+    results = {}
+    for window in windows:
+        mean = np.full((n_dates, n_tickers), np.nan)
+        std = np.full((n_dates, n_tickers), np.nan)
+        if n_dates >= window:
+            wsum = csum[window:] - csum[:-window]
+            wsq = csq[window:] - csq[:-window]
+            complete = (ccount[window:] - ccount[:-window]) == window
+            wmean = wsum / window
+            wvar = np.clip(wsq / window - wmean ** 2, 0.0, None)
+            mean[window - 1:] = np.where(complete, wmean + offset, np.nan)
+            std[window - 1:] = np.where(complete, np.sqrt(wvar), np.nan)
+        results[window] = (mean, std)
+    return results
+
+
+def _ema(values: np.ndarray, alphas: np.ndarray, windows: np.ndarray, state: np.ndarray,
+         seen: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Exponential smoothing for several alphas in a single pass over the dates.
+
+    values has shape (dates, tickers); state and seen have shape (len(alphas), tickers) and hold
+    the last smoothed value and the number of valid observations so far. Like TA-Lib / Alpha
+    Vantage, each series is seeded with the simple average of its first `window` observations
+    and is NaN before that and on missing bars.
+    Returns the smoothed values with shape (len(alphas), dates, tickers) and the new state/seen.
+    """
+    alphas = alphas[:, None]
+    windows = windows[:, None]
+    out = np.full((len(alphas),) + values.shape, np.nan)
+    prev = state.copy()
+    seen = seen.copy()
+    for t in range(values.shape[0]):
+        x = values[t]
+        missing = np.isnan(x)
+        # running mean during warm-up, recursive smoothing afterwards
+        weight = np.where(seen < windows, 1.0 / (seen + 1), alphas)
+        prev = np.where(missing, prev, np.where(seen == 0, x, weight * x + (1 - weight) * prev))
+        seen = seen + ~missing
+        out[:, t] = np.where(missing | (seen < windows), np.nan, prev)
+    return out, prev, seen
+
+
+def _forward_fill(values: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs column-wise, continuing from the last known values."""
+    stacked = pd.DataFrame(np.vstack([last, values])).ffill().to_numpy()
+    return stacked
+
+
+# ======================== ENGINE ============================
+
+class TechnicalIndicatorEngine:
+    """
+    Computes technical indicators locally from a price matrix (index = dates, columns = tickers).
+
+    All tickers and all window lengths of an indicator are processed together. Rolling indicators
+    (SMA, Bollinger) use cumulative sums, recursive indicators (EMA, RSI, MACD, ATR) keep their
+    smoothing state so that update() only has to process newly appended bars.
+
+    EMA, RSI and ATR are seeded with the simple average of their first `window` observations,
+    like TA-Lib and Alpha Vantage, so values match those sources from the first emitted bar.
+    The MACD fast line is seeded at its own start rather than aligned to the slow line as in
+    TA-Lib, so MACD can differ slightly from Alpha Vantage during the warm-up period.
+    Missing bars (e.g. exchange holidays in a multi-ticker download) give NaN for that ticker
+    and bar and leave the smoothing state untouched.
+    """
+
+    def __init__(self, sma_windows=(20,), ema_windows=(20,), rsi_windows=(14,), bollinger_windows=(20,),
+                 atr_windows=(14,), macd_params=(12, 26, 9), bollinger_std: float = 2.0):
+        windows = list(sma_windows) + list(ema_windows) + list(rsi_windows) + list(bollinger_windows) \
+            + list(atr_windows) + list(macd_params or [])
+        for window in windows:
+            if int(window) != window or window < 1:
+                raise ValueError(f"Window lengths must be positive integers, got {window}")
+        if macd_params and len(macd_params) != 3:
+            raise ValueError("macd_params must be (fast, slow, signal)")
+        if bollinger_std <= 0:
+            raise ValueError(f"bollinger_std must be positive, got {bollinger_std}")
+        self.sma_windows = list(sma_windows)
+        self.ema_windows = list(ema_windows)
+        self.rsi_windows = list(rsi_windows)
+        self.bollinger_windows = list(bollinger_windows)
+        self.atr_windows = list(atr_windows)
+        self.macd_params = macd_params
+        self.bollinger_std = bollinger_std
+        self.tickers = None
+
+    def fit(self, close: pd.DataFrame, high: pd.DataFrame = None, low: pd.DataFrame = None) -> dict:
+        """Computes all indicators over the full history and stores the state for update()."""
+        if isinstance(close, pd.Series):
+            close = close.to_frame()
+        if not close.index.is_monotonic_increasing:
+            raise ValueError("Price data must be sorted by date")
+        if (high is None) != (low is None):
+            raise ValueError("ATR needs both high and low data, got only one of them")
+        self.tickers = list(close.columns)
+        n_tickers = len(self.tickers)
+        self._has_high_low = high is not None
+        self._last_date = None
+        if self.atr_windows and not self._has_high_low:
+            logger.warning("No high/low data given, ATR is not computed")
+
+        # EMA windows and the MACD fast/slow windows share one smoothing pass
+        fast, slow, _ = self.macd_params if self.macd_params else (None, None, None)
+        self._ema_spans = self.ema_windows + ([fast, slow] if self.macd_params else [])
+        roll_windows = self.sma_windows + self.bollinger_windows
+
+        self._tail = np.empty((0, n_tickers))
+        self._tail_length = max(roll_windows) - 1 if roll_windows else 0
+        self._last_close = np.full((1, n_tickers), np.nan)
+        self._ema_state = np.full((len(self._ema_spans), n_tickers), np.nan)
+        self._ema_seen = np.zeros((len(self._ema_spans), n_tickers))
+        self._gain_state = np.full((len(self.rsi_windows), n_tickers), np.nan)
+        self._gain_seen = np.zeros((len(self.rsi_windows), n_tickers))
+        self._loss_state = np.full((len(self.rsi_windows), n_tickers), np.nan)
+        self._loss_seen = np.zeros((len(self.rsi_windows), n_tickers))
+        self._signal_state = np.full((1, n_tickers), np.nan)
+        self._signal_seen = np.zeros((1, n_tickers))
+        self._atr_state = np.full((len(self.atr_windows), n_tickers), np.nan)
+        self._atr_seen = np.zeros((len(self.atr_windows), n_tickers))
+
+        return self._process(close, high, low)
+
+    def update(self, close: pd.DataFrame, high: pd.DataFrame = None, low: pd.DataFrame = None) -> dict:
+        """Computes the indicators for newly appended bars only, continuing from the stored state.
+
+        Bars up to the last processed date are skipped. The ticker universe is fixed by fit():
+        new tickers raise a ValueError (fit a new engine instead), fitted tickers missing from
+        close are treated as missing bars.
+        """
+        if self.tickers is None:
+            raise ValueError("Engine must be fitted before calling update()")
+        if isinstance(close, pd.Series):
+            close = close.to_frame()
+        if not close.index.is_monotonic_increasing:
+            raise ValueError("Price data must be sorted by date")
+        unknown = [t for t in close.columns if t not in self.tickers]
+        if unknown:
+            raise ValueError(f"Tickers not seen in fit(): {', '.join(map(str, unknown))}")
+        if (high is None) != (low is None):
+            raise ValueError("ATR needs both high and low data, got only one of them")
+        if self._has_high_low and high is None:
+            raise ValueError("Engine was fitted with high/low data, update() needs them as well for ATR")
+        if not self._has_high_low and high is not None and self.atr_windows:
+            logger.warning("Engine was fitted without high/low data, ignoring them in update()")
+
+        # bars up to the last processed date were already smoothed, only take the appended ones
+        if self._last_date is not None:
+            new_bars = close.index > self._last_date
+            close = close[new_bars]
+            if high is not None and low is not None:
+                high = high.reindex(close.index)
+                low = low.reindex(close.index)
+        return self._process(close, high, low)
+
+    def _process(self, close: pd.DataFrame, high: pd.DataFrame, low: pd.DataFrame) -> dict:
+        index = close.index
+        values = close.reindex(columns=self.tickers).to_numpy(dtype=float)
+        n_new = values.shape[0]
+        results = {}
+
+        def frame(arr):
+            return pd.DataFrame(arr, index=index, columns=self.tickers)
+
+        # --- rolling indicators over the stored tail plus the new bars ---
+        extended = np.vstack([self._tail, values])
+        windows = sorted(set(self.sma_windows + self.bollinger_windows))
+        moments = _rolling_moments(extended, windows)
+        for window in self.sma_windows:
+            results[f"SMA_{window}"] = frame(moments[window][0][len(self._tail):])
+        for window in self.bollinger_windows:
+            mean, std = (m[len(self._tail):] for m in moments[window])
+            results[f"BB_upper_{window}"] = frame(mean + self.bollinger_std * std)
+            results[f"BB_middle_{window}"] = frame(mean)
+            results[f"BB_lower_{window}"] = frame(mean - self.bollinger_std * std)
+        if self._tail_length:
+            self._tail = extended[-self._tail_length:]
+
+        # --- EMA and MACD ---
+        if self._ema_spans:
+            spans = np.array(self._ema_spans, dtype=float)
+            emas, self._ema_state, self._ema_seen = _ema(values, 2.0 / (spans + 1.0), spans, self._ema_state,
+                                                         self._ema_seen)
+            for i, span in enumerate(self.ema_windows):
+                results[f"EMA_{span}"] = frame(emas[i])
+
+            if self.macd_params:
+                fast, slow, signal = self.macd_params
+                macd = emas[-2] - emas[-1]
+                signal_line, self._signal_state, self._signal_seen = _ema(
+                    macd, np.array([2.0 / (signal + 1.0)]), np.array([float(signal)]), self._signal_state,
+                    self._signal_seen)
+                signal_line = signal_line[0]
+                results["MACD"] = frame(macd)
+                results["MACD_signal"] = frame(signal_line)
+                results["MACD_hist"] = frame(macd - signal_line)
+
+        # --- previous valid close per ticker, needed by RSI and ATR ---
+        filled = _forward_fill(values, self._last_close)
+        prev_close = filled[:-1]
+        self._last_close = filled[-1:]
+
+        # --- RSI (Wilder smoothing) ---
+        if self.rsi_windows:
+            delta = values - prev_close
+            windows = np.array(self.rsi_windows, dtype=float)
+            gains, self._gain_state, self._gain_seen = _ema(np.clip(delta, 0.0, None), 1.0 / windows, windows,
+                                                            self._gain_state, self._gain_seen)
+            losses, self._loss_state, self._loss_seen = _ema(np.clip(-delta, 0.0, None), 1.0 / windows, windows,
+                                                             self._loss_state, self._loss_seen)
+            for i, window in enumerate(self.rsi_windows):
+                total = gains[i] + losses[i]
+                rsi = np.divide(100.0 * gains[i], total, out=np.full_like(total, np.nan), where=total > 0)
+                results[f"RSI_{window}"] = frame(np.where(total == 0, 50.0, rsi))
+
+        # --- ATR (Wilder smoothing of the true range) ---
+        if self.atr_windows:
+            if self._has_high_low:
+                h = high.reindex(index=index, columns=self.tickers).to_numpy(dtype=float)
+                l = low.reindex(index=index, columns=self.tickers).to_numpy(dtype=float)
+                true_range = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+                # the first bar has no previous close, TA-Lib starts the true range on the second bar
+                true_range = np.where(np.isnan(h - l) | np.isnan(prev_close), np.nan, true_range)
+                windows = np.array(self.atr_windows, dtype=float)
+                atrs, self._atr_state, self._atr_seen = _ema(true_range, 1.0 / windows, windows, self._atr_state,
+                                                             self._atr_seen)
+                for i, window in enumerate(self.atr_windows):
+                    results[f"ATR_{window}"] = frame(atrs[i])
+
+        if n_new:
+            self._last_date = index[-1]
+        return results
+
+
+def compute_technical_indicators(close: pd.DataFrame, high: pd.DataFrame = None, low: pd.DataFrame = None,
+                                 **params) -> dict:
+    """Convenience wrapper: computes all indicators for a price matrix in one call."""
+    return TechnicalIndicatorEngine(**params).fit(close, high, low)
+
+
+if __name__ == "__main__":
+    # Self-check on synthetic prices: incremental updates must match a single fit, and the
+    # results must match pandas references seeded with the SMA of the first `window` values.
+    def seeded_smoothing(series: pd.Series, alpha: float, window: int) -> pd.Series:
+        valid = series.dropna()
+        seed = pd.Series([valid.iloc[:window].mean()], index=valid.index[window - 1:window])
+        smoothed = pd.concat([seed, valid.iloc[window:]]).ewm(alpha=alpha, adjust=False).mean()
+        return smoothed.reindex(series.index)
+
+    def seeded_rsi(series: pd.Series, window: int) -> pd.Series:
+        delta = series.dropna().diff()
+        gain = seeded_smoothing(delta.clip(lower=0), 1 / window, window)
+        loss = seeded_smoothing((-delta).clip(lower=0), 1 / window, window)
+        return (100 * gain / (gain + loss)).reindex(series.index)
+
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2000-01-01", periods=3000)
+    close = pd.DataFrame(500_000 * np.exp(np.cumsum(rng.normal(0, 0.01, (3000, 3)), axis=0)),
+                         index=dates, columns=["A", "B", "C"])
+    close.iloc[:50, 2] = np.nan
+    close.iloc[[500, 1500], 0] = np.nan  # holidays in the middle of a series
+    high, low = close * 1.01, close * 0.99
+    params = dict(sma_windows=(5, 20), ema_windows=(10, 50), rsi_windows=(14,), bollinger_windows=(20,))
+
+    full = TechnicalIndicatorEngine(**params).fit(close, high, low)
+
+    # fit on the first part, then pass overlapping slices of the refreshed cache
+    engine = TechnicalIndicatorEngine(**params)
+    parts = [engine.fit(close[:1000], high[:1000], low[:1000]),
+             engine.update(close[:2000], high[:2000], low[:2000]),
+             engine.update(close[:2000], high[:2000], low[:2000]),
+             engine.update(close, high, low)]
+    for key, expected in full.items():
+        combined = pd.concat([part[key] for part in parts])
+        assert combined.index.equals(expected.index), key
+        assert np.allclose(combined, expected, rtol=1e-9, equal_nan=True), key
+
+    # every indicator is NaN on a missing bar
+    for key, result in full.items():
+        assert result["A"].iloc[[500, 1500]].isna().all(), key
+
+    rolling = close.rolling(20)
+    assert np.allclose(full["SMA_20"], rolling.mean(), rtol=1e-9, equal_nan=True)
+    assert np.allclose(full["BB_upper_20"] - full["BB_middle_20"], 2 * rolling.std(ddof=0), rtol=1e-6,
+                       equal_nan=True)
+    for ticker in close.columns:
+        ema = seeded_smoothing(close[ticker], 2 / 11, 10)
+        assert np.allclose(full["EMA_10"][ticker], ema, rtol=1e-9, equal_nan=True)
+        assert np.allclose(full["RSI_14"][ticker], seeded_rsi(close[ticker], 14), rtol=1e-9, equal_nan=True)
+
+    for kwargs in [dict(sma_windows=(0,)), dict(macd_params=(12, 26)), dict(bollinger_std=0)]:
+        try:
+            TechnicalIndicatorEngine(**kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"invalid parameters accepted: {kwargs}")
+    try:
+        TechnicalIndicatorEngine().fit(close, high=high)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("high without low accepted")
+    try:
+        engine.update(close.assign(D=close["A"]), high, low)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown ticker accepted in update()")
+    print("Technical indicator self-check passed")